@@ -104,6 +104,13 @@ def cli() -> None:  # pragma: no cover
         action="store_true",
         help="Use lxml.",
     )
+    parser_group.add_argument(
+        "--selectolax",
+        dest="selectolax",
+        default=False,
+        action="store_true",
+        help="Use Selectolax.",
+    )
     parser_group.add_argument(
         "--pyppeteer",
         dest="pyppeteer",
@@ -223,6 +230,8 @@ def cli() -> None:  # pragma: no cover
         parser_type = "parsel"
     elif arguments.lxml:
         parser_type = "lxml"
+    elif arguments.selectolax:
+        parser_type = "selectolax"
     elif arguments.pyppeteer:
         parser_type = "pyppeteer"
     elif arguments.selenium:
@@ -236,7 +245,7 @@ def cli() -> None:  # pragma: no cover
                 "username": arguments.proxy_user or "",
                 "password": arguments.proxy_pass or "",
             }
-        elif parser_type in ("bs4", "parsel", "lxml"):
+        elif parser_type in ("bs4", "parsel", "lxml", "selectolax"):
             user_info = ""
             if arguments.proxy_user and arguments.proxy_pass:
                 user_info = f"{arguments.proxy_user}:{arguments.proxy_pass}@"
@@ -582,16 +582,20 @@ class ScraperAbstract(ScraperBase):
         return sorted(filter(rule_filter(url, navigate=True), self.rules), key=lambda r: r.priority)
 
     def get_flattened_data(self) -> List[Dict]:
-        items = []
+        items: List[Dict] = []
         for _, g in itertools.groupby(sorted(self.collected_data, key=scraped_data_sorter), key=scraped_data_grouper):
-            item: Dict = {}
+            first = next(g)
+            # FIXME: Keys defined in handler functions might duplicate predefined keys
+            item: Dict[str, Any] = {
+                "_page_number": first.page_number,
+                "_page_url": first.page_url,
+                "_group_id": first.group_id,
+                "_group_index": first.group_index,
+                "_element_index": first.element_index,
+                **first.data,
+            }
             for d in g:
-                for k, v in d._asdict().items():
-                    if k == "data":
-                        # FIXME: Keys defined in handler functions might duplicate predefined keys
-                        item.update(**v)
-                    elif k not in item:
-                        item[f"_{k}"] = v
+                item.update(d.data)
             items.append(item)
         return items
 
@@ -1,6 +1,6 @@
 import itertools
 import logging
-from typing import Any, AsyncIterable, Callable, Iterable, Optional, Sequence, Tuple
+from typing import Any, AsyncIterable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 from urllib.parse import urljoin
 
 import httpx
@@ -8,7 +8,7 @@ from bs4 import BeautifulSoup
 from httpx._types import ProxiesTypes
 
 from ..base import ScraperAbstract
-from ..rule import Selector, SelectorType, rule_grouper, rule_sorter
+from ..rule import Selector, SelectorType, classify_css, rule_grouper, rule_sorter
 from .utils import HTTPXMixin, async_http_get, http_get
 
 logger = logging.getLogger(__name__)
@@ -19,6 +19,9 @@ class BeautifulSoupScraper(ScraperAbstract, HTTPXMixin):
     Scraper using BeautifulSoup4 parser and HTTPX for requests
     """
 
+    # lxml is used as the underlying tree builder since it is significantly faster than the pure-Python "html.parser"
+    features = "lxml"
+
     def run(
         self,
         urls: Sequence[str],
@@ -73,7 +76,7 @@ class BeautifulSoupScraper(ScraperAbstract, HTTPXMixin):
                     if not content:
                         break
 
-                    soup = BeautifulSoup(content, "html.parser")
+                    soup = BeautifulSoup(content, self.features)
                     if follow_urls:
                         for link in soup.find_all("a", href=True):
                             absolute = urljoin(url, link["href"])
@@ -109,7 +112,7 @@ class BeautifulSoupScraper(ScraperAbstract, HTTPXMixin):
                     if not content:
                         break
 
-                    soup = BeautifulSoup(content, "html.parser")
+                    soup = BeautifulSoup(content, self.features)
                     if follow_urls:
                         for link in soup.find_all("a", href=True):
                             absolute = urljoin(url, link["href"])
@@ -163,15 +166,26 @@ class BeautifulSoupScraper(ScraperAbstract, HTTPXMixin):
             rules = list(sorted(g, key=lambda r: r.priority))
 
             for group_index, group in enumerate(self._get_elements(soup, group_selector)):
+                # rules sharing the same selector only need a single traversal of the group
+                elements: Dict[Selector, List[Any]] = {}
                 for rule in rules:
-                    for element_index, element in enumerate(self._get_elements(group, rule.selector)):
+                    if rule.selector not in elements:
+                        elements[rule.selector] = list(self._get_elements(group, rule.selector))
+                    for element_index, element in enumerate(elements[rule.selector]):
                         yield url, group_index, id(group), element_index, element, rule.handler
 
     @staticmethod
     def _get_elements(soup: BeautifulSoup, selector: Selector) -> Iterable[BeautifulSoup]:
         selector_type = selector.selector_type()
         if selector_type in (SelectorType.CSS, SelectorType.ANY):  # assume CSS
-            yield from soup.select(selector.to_str())
+            selector_str = selector.to_str()
+            simple = classify_css(selector_str)
+            if simple is None:
+                yield from soup.select(selector_str)
+            elif simple[0] == "class":
+                yield from soup.find_all(class_=simple[1])
+            else:
+                yield from soup.find_all(id=simple[1])
         elif selector_type == SelectorType.XPATH:
             raise Exception("XPath selector is not supported.")
         elif selector_type == SelectorType.TEXT:
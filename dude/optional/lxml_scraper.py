@@ -1,19 +1,32 @@
+import functools
 import itertools
 import logging
-from typing import Any, AsyncIterable, Callable, Iterable, Optional, Sequence, Tuple
+from typing import Any, AsyncIterable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 from urllib.parse import urljoin
 
 import httpx
 import lxml.html
 from httpx._types import ProxiesTypes
-from lxml.etree import _Element, _ElementTree
+from lxml.cssselect import CSSSelector
+from lxml.etree import XPath, _Element, _ElementTree
 
 from ..base import ScraperAbstract
-from ..rule import Selector, SelectorType, rule_grouper, rule_sorter
+from ..rule import Selector, SelectorType, classify_css, rule_grouper, rule_sorter
 from .utils import HTTPXMixin, async_http_get, http_get
 
 logger = logging.getLogger(__name__)
 
+# same expression generated by cssselect for "#<id>"
+_id_xpath = XPath("descendant-or-self::*[@id = $id]")
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_css(selector: str) -> CSSSelector:
+    """
+    Compiles a CSS selector into XPath once so that it can be reused on every page and group.
+    """
+    return CSSSelector(selector, translator="html")
+
 
 class LxmlScraper(ScraperAbstract, HTTPXMixin):
     """
@@ -167,8 +180,12 @@ class LxmlScraper(ScraperAbstract, HTTPXMixin):
             rules = list(sorted(g, key=lambda r: r.priority))
 
             for group_index, group in enumerate(self._get_elements(tree, group_selector)):
+                # rules sharing the same selector only need a single traversal of the group
+                elements: Dict[Selector, List[Any]] = {}
                 for rule in rules:
-                    for element_index, element in enumerate(self._get_elements(group, rule.selector)):
+                    if rule.selector not in elements:
+                        elements[rule.selector] = list(self._get_elements(group, rule.selector))
+                    for element_index, element in enumerate(elements[rule.selector]):
                         yield url, group_index, id(group), element_index, element, rule.handler
 
     @staticmethod
@@ -176,7 +193,13 @@ class LxmlScraper(ScraperAbstract, HTTPXMixin):
         selector_str = selector.to_str()
         selector_type = selector.selector_type()
         if selector_type in (SelectorType.CSS, SelectorType.ANY):  # assume CSS
-            yield from tree.cssselect(selector_str)
+            simple = classify_css(selector_str)
+            if simple is None:
+                yield from _compile_css(selector_str)(tree)
+            elif simple[0] == "class":
+                yield from tree.find_class(simple[1])
+            else:
+                yield from _id_xpath(tree, id=simple[1])
         elif selector_type == SelectorType.XPATH:
             yield from tree.xpath(selector_str)
         elif selector_type == SelectorType.TEXT:
@@ -1,6 +1,6 @@
 import itertools
 import logging
-from typing import Any, AsyncIterable, Callable, Iterable, Optional, Sequence, Tuple
+from typing import Any, AsyncIterable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 from urllib.parse import urljoin
 
 import httpx
@@ -165,8 +165,12 @@ class ParselScraper(ScraperAbstract, HTTPXMixin):
             rules = list(sorted(g, key=lambda r: r.priority))
 
             for group_index, group in enumerate(self._get_elements(selector, group_selector)):
+                # rules sharing the same selector only need a single traversal of the group
+                elements: Dict[Selector, List[Any]] = {}
                 for rule in rules:
-                    for element_index, element in enumerate(self._get_elements(group, rule.selector)):
+                    if rule.selector not in elements:
+                        elements[rule.selector] = list(self._get_elements(group, rule.selector))
+                    for element_index, element in enumerate(elements[rule.selector]):
                         yield url, group_index, id(group), element_index, element, rule.handler
 
     @staticmethod
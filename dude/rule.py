@@ -1,7 +1,11 @@
 import fnmatch
+import functools
+import re
 from enum import Enum, auto
 from typing import Callable, NamedTuple, Optional, Tuple, Union
 
+SIMPLE_CSS_PATTERN = re.compile(r"^([.#])(-?[_a-zA-Z][_a-zA-Z0-9-]*)$")
+
 
 class SelectorType(Enum):
     ANY = auto()
@@ -84,3 +88,18 @@ def rule_filter(url: str, setup: bool = False, navigate: bool = False) -> Callab
         return matches and rule.setup is setup and rule.navigate is navigate
 
     return wrapper
+
+
+@functools.lru_cache(maxsize=512)
+def classify_css(selector: str) -> Optional[Tuple[str, str]]:
+    """
+    Classifies trivial CSS selectors that can be matched without a full CSS engine.
+
+    :param selector: CSS selector.
+    :return: ("class", name) for ".name", ("id", name) for "#name" or None for any other selector.
+    """
+    match = SIMPLE_CSS_PATTERN.match(selector)
+    if not match:
+        return None
+    prefix, name = match.groups()
+    return ("class" if prefix == "." else "id"), name
@@ -1,10 +1,58 @@
+import codecs
+import itertools
 import logging
+import math
 import sys
-from typing import Dict, List, Optional, Set
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 
+class ColumnStore:
+    """
+    Column-oriented buffer of scraped rows.
+
+    Rows may not share the same keys, missing values are stored as None which the csv module writes as empty strings.
+    """
+
+    __slots__ = ("_cols", "_length")
+
+    def __init__(self) -> None:
+        self._cols: Dict[str, List[Any]] = {}
+        self._length = 0
+
+    def append_row(self, row: Dict[str, Any]) -> None:
+        """
+        Appends the values of a row to their columns.
+
+        :param row: Scraped data.
+        """
+        cols = self._cols
+        for key, value in row.items():
+            col = cols.get(key)
+            if col is None:
+                col = cols[key] = [None] * self._length
+            col.append(value)
+        self._length += 1
+        if len(row) < len(cols):
+            for col in cols.values():
+                if len(col) < self._length:
+                    col.append(None)
+
+    @property
+    def headers(self) -> List[str]:
+        return sorted(self._cols)
+
+    def rows(self) -> Iterator[Tuple[Any, ...]]:
+        """
+        Iterates over the rows as tuples ordered by headers.
+        """
+        if not self._cols:
+            # zip() of no columns would drop rows that had no keys at all
+            return itertools.repeat((), self._length)
+        return zip(*(self._cols[header] for header in self.headers))
+
+
 def save_json(data: List[Dict], output: Optional[str]) -> bool:
     """
     Saves data to JSON.
@@ -16,17 +64,13 @@ def save_json(data: List[Dict], output: Optional[str]) -> bool:
     if output is not None:
         _save_json(data, output)
     else:
-        import json
-
-        json.dump(data, sys.stdout, indent=2)
+        _dump_json(data, sys.stdout)
     return True
 
 
 def _save_json(data: List[Dict], output: str) -> None:  # pragma: no cover
-    import json
-
-    with open(output, "w") as f:
-        json.dump(data, f, indent=2)
+    with open(output, "w", encoding="utf-8") as f:
+        _dump_json(data, f)
     logger.info("%d items saved to %s.", len(data), output)
 
 
@@ -41,11 +85,9 @@ def save_csv(data: List[Dict], output: Optional[str]) -> bool:
     if output is not None:
         _save_csv(data, output)
     else:
-        import json
-
         # TODO: find a better way to present a table if output is not None
         logger.warning("Printing CSV to terminal is currently not supported. Defaulting to json.")
-        json.dump(data, sys.stdout, indent=2)
+        _dump_json(data, sys.stdout)
     return True
 
 
@@ -63,22 +105,20 @@ def save_yaml(data: List[Dict], output: Optional[str]) -> bool:
     else:
         import yaml
 
-        yaml.safe_dump(data, sys.stdout)
+        yaml.dump(data, sys.stdout, Dumper=_yaml_dumper())
     return True
 
 
 def _save_csv(data: List[Dict], output: str) -> None:  # pragma: no cover
     import csv
 
-    headers: Set[str] = set()
-    rows = []
+    store = ColumnStore()
     for item in data:
-        headers.update(item.keys())
-        rows.append(item)
+        store.append_row(item)
     with open(output, "w") as f:
-        writer = csv.DictWriter(f, fieldnames=sorted(headers))
-        writer.writeheader()
-        writer.writerows(rows)
+        writer = csv.writer(f)
+        writer.writerow(store.headers)
+        writer.writerows(store.rows())
     logger.info("%d items saved to %s.", len(data), output)
 
 
@@ -86,5 +126,71 @@ def _save_yaml(data: List[Dict], output: str) -> None:  # pragma: no cover
     import yaml
 
     with open(output, "w") as f:
-        yaml.safe_dump(data, f)
+        yaml.dump(data, f, Dumper=_yaml_dumper())
     logger.info("%d items saved to %s.", len(data), output)
+
+
+def _dump_json(data: List[Dict], f: IO[str]) -> None:
+    """
+    Writes indented JSON.
+
+    orjson is used when it is installed, the stream is UTF-8 encoded and the data only holds plain JSON types
+    (exact str, int, bool, None, finite float, dict, list and tuple, with str or int keys). Anything else, such as
+    Enum and UUID values which orjson would serialize natively, integers beyond 64 bits, NaN and subclasses, goes to
+    json.dump() so that it is written or rejected exactly as without orjson. Non-ASCII characters are not escaped on
+    UTF-8 streams on either path. The only remaining difference is the exponent format of large and small floats,
+    e.g. orjson writes 1e16 and 1e-7 where json.dump() writes 1e+16 and 1e-07.
+    """
+    encoding = getattr(f, "encoding", None)
+    is_utf8 = codecs.lookup(encoding).name == "utf-8" if encoding else False
+    if is_utf8 and _is_plain_json(data):
+        try:
+            import orjson
+        except ImportError:
+            pass
+        else:
+            try:
+                content = orjson.dumps(
+                    data,
+                    option=orjson.OPT_INDENT_2
+                    | orjson.OPT_NON_STR_KEYS
+                    | orjson.OPT_PASSTHROUGH_DATETIME
+                    | orjson.OPT_PASSTHROUGH_DATACLASS
+                    | orjson.OPT_PASSTHROUGH_SUBCLASS,
+                )
+            except orjson.JSONEncodeError:
+                pass
+            else:
+                f.write(content.decode("utf-8"))
+                return
+
+    import json
+
+    json.dump(data, f, indent=2, ensure_ascii=not is_utf8)
+
+
+_JSON_SCALARS = (str, int, bool, type(None))
+_JSON_KEYS = (str, int)
+
+
+def _is_plain_json(obj: Any) -> bool:
+    obj_type = type(obj)
+    if obj_type is float:
+        return math.isfinite(obj)
+    if obj_type is dict:
+        return all(
+            type(key) in _JSON_KEYS and (type(value) in _JSON_SCALARS or _is_plain_json(value))
+            for key, value in obj.items()
+        )
+    if obj_type is list or obj_type is tuple:
+        return all(type(value) in _JSON_SCALARS or _is_plain_json(value) for value in obj)
+    return obj_type in _JSON_SCALARS
+
+
+def _yaml_dumper() -> Any:
+    """
+    Returns the libyaml-backed safe dumper when PyYAML was built with it, falling back to the pure Python one.
+    """
+    import yaml
+
+    return getattr(yaml, "CSafeDumper", yaml.SafeDumper)
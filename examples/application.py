@@ -21,5 +21,5 @@ def result_description(element):
 if __name__ == "__main__":
     from pathlib import Path
 
-    html = f"file://{(Path(__file__).resolve().parent / 'dude.html').absolute()}"
+    html = f"file://{Path(__file__).resolve().parent / 'dude.html'}"
     app.run(urls=[html])
@@ -22,5 +22,5 @@ if __name__ == "__main__":
 
     import dude
 
-    html = f"file://{(Path(__file__).resolve().parent / 'dude.html').absolute()}"
+    html = f"file://{Path(__file__).resolve().parent / 'dude.html'}"
     dude.run(urls=[html], format="table")
@@ -24,5 +24,5 @@ if __name__ == "__main__":
 
     import dude
 
-    html = f"file://{(Path(__file__).resolve().parent / 'dude.html').absolute()}"
+    html = f"file://{Path(__file__).resolve().parent / 'dude.html'}"
     dude.run(urls=[html])
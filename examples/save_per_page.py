@@ -34,5 +34,5 @@ def save_jsonl(data, output) -> bool:
 if __name__ == "__main__":
     import dude
 
-    html = f"file://{(Path(__file__).resolve().parent / 'dude.html').absolute()}"
+    html = f"file://{Path(__file__).resolve().parent / 'dude.html'}"
     dude.run(urls=[html], format="jsonl", save_per_page=True)
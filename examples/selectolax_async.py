@@ -0,0 +1,31 @@
+from dude import select
+
+"""
+This example demonstrates how to use Selectolax + async HTTPX
+
+To access an attribute, use:
+    node.attributes["href"]
+To get the text, use:
+    node.text()
+"""
+
+
+@select(css="a.url", priority=2)
+async def result_url(node):
+    return {"url": node.attributes["href"]}
+
+
+@select(css=".title", priority=1)
+async def result_title(node):
+    return {"title": node.text()}
+
+
+@select(css=".description", priority=0)
+async def result_description(node):
+    return {"description": node.text()}
+
+
+if __name__ == "__main__":
+    import dude
+
+    dude.run(urls=["https://dude.ron.sh"], parser="selectolax")
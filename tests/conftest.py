@@ -1,19 +1,60 @@
 import platform
 import re
+import sys
 from pathlib import Path
-from typing import Any, Dict, Generator, List, Optional
-from unittest import mock
+from typing import Any, Dict, Generator, List, Optional, Tuple
 from urllib.parse import urljoin
 
 import pytest
 import respx
+import yaml
 from httpx import Response
 from respx import Router
 
-from dude import Scraper
+from dude import Scraper, storage
+
+
+class CallRecorder:
+    """
+    Lightweight replacement for MagicMock when only the calls need to be recorded.
+    """
+
+    __slots__ = ("calls", "return_value")
+
+    def __init__(self, return_value: Any = None) -> None:
+        self.calls: List[Tuple[Tuple, Dict]] = []
+        self.return_value = return_value
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.calls.append((args, kwargs))
+        return self.return_value
+
+    def assert_called_with(self, *args: Any, **kwargs: Any) -> None:
+        assert self.calls, "Expected to be called."
+        assert self.calls[-1] == (args, kwargs)
+
+    def assert_called(self) -> None:
+        assert self.calls, "Expected to be called."
+
+    def assert_called_once(self) -> None:
+        assert len(self.calls) == 1, f"Expected to be called once. Called {len(self.calls)} times."
+
+    def assert_not_called(self) -> None:
+        assert not self.calls, f"Expected not to be called. Called {len(self.calls)} times."
+
+
+class MockDatabase:
+    __slots__ = ("setup", "save", "close")
+
+    def __init__(self) -> None:
+        self.setup = CallRecorder()
+        self.save = CallRecorder()
+        self.close = CallRecorder()
 
 
 class IsInteger:
+    __slots__ = ()
+
     def __eq__(self, other: Any) -> bool:
         return isinstance(other, int)
 
@@ -22,32 +63,43 @@ class IsInteger:
 
 
 class IsUrl:
+    __slots__ = ("url", "full_url")
+
     def __init__(self, url: str, full_html_path: str):
-        self.url = url
-        self.full_html_path = full_html_path
+        self.url = sys.intern(url)
+        self.full_url = urljoin(full_html_path, url)
 
     def __eq__(self, other: Any) -> bool:
         """
         When loading an HTML file from local, Pyppeteer and Selenium prepends "file://" to href.
         On Windows, "file:///<Drive>:" is prepended, e.g. "file:///D:".
         """
-        return isinstance(other, str) and (other == self.url or other == urljoin(self.full_html_path, self.url))
+        return isinstance(other, str) and (other == self.url or other == self.full_url)
 
     def __repr__(self) -> str:
         return f"IsUrl: {self.url}"
 
 
-@pytest.fixture()
+IS_INTEGER = IsInteger()
+_TEST_HTML_PATH = str(Path(__file__).resolve().parent.parent / "examples/dude.html")
+
+
+@pytest.fixture(scope="session")
 def test_html_path() -> str:
-    return str((Path(__file__).resolve().parent.parent / "examples/dude.html").absolute())
+    return _TEST_HTML_PATH
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
+def test_html_content(test_html_path: str) -> str:
+    return Path(test_html_path).read_text()
+
+
+@pytest.fixture(scope="session")
 def base_url() -> str:
     return "https://dwmc.ron.sh"
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def file_url(test_html_path: str) -> str:
     if platform.system() == "Windows":
         return f"file:///{test_html_path}".replace("\\", "/")
@@ -60,25 +112,41 @@ def blocked_url(base_url: str) -> str:
 
 
 @pytest.fixture
-def mock_httpx(test_html_path: str, base_url: str) -> Generator[Router, None, None]:
-    with respx.mock(base_url=base_url, assert_all_called=False) as r, open(test_html_path) as f:
-        content = f.read()
-        r.get("/").mock(return_value=Response(200, content=content))
-        r.post("/").mock(return_value=Response(200, content=content))
-        r.put("/").mock(return_value=Response(200, content=content))
-        r.patch("/").mock(return_value=Response(200, content=content))
+def mock_httpx(test_html_content: str, base_url: str) -> Generator[Router, None, None]:
+    with respx.mock(base_url=base_url, assert_all_called=False) as r:
+        r.get("/").mock(return_value=Response(200, content=test_html_content))
+        r.post("/").mock(return_value=Response(200, content=test_html_content))
+        r.put("/").mock(return_value=Response(200, content=test_html_content))
+        r.patch("/").mock(return_value=Response(200, content=test_html_content))
         r.get(re.compile(".*")).mock(return_value=Response(404))
         yield r
 
 
 @pytest.fixture()
-def mock_database() -> mock.MagicMock:
-    return mock.MagicMock()
+def mock_database() -> MockDatabase:
+    return MockDatabase()
 
 
 @pytest.fixture()
-def mock_database_per_page() -> mock.MagicMock:
-    return mock.MagicMock()
+def mock_database_per_page() -> MockDatabase:
+    return MockDatabase()
+
+
+@pytest.fixture()
+def patched_storage(monkeypatch: pytest.MonkeyPatch) -> Dict[str, CallRecorder]:
+    recorders = {
+        "_dump_json": CallRecorder(),
+        "yaml.dump": CallRecorder(),
+        "_save_json": CallRecorder(),
+        "_save_csv": CallRecorder(),
+        "_save_yaml": CallRecorder(),
+    }
+    monkeypatch.setattr(storage, "_dump_json", recorders["_dump_json"])
+    monkeypatch.setattr(yaml, "dump", recorders["yaml.dump"])
+    monkeypatch.setattr(storage, "_save_json", recorders["_save_json"])
+    monkeypatch.setattr(storage, "_save_csv", recorders["_save_csv"])
+    monkeypatch.setattr(storage, "_save_yaml", recorders["_save_yaml"])
+    return recorders
 
 
 @pytest.fixture()
@@ -88,7 +156,7 @@ def scraper_application() -> Scraper:
 
 @pytest.fixture()
 def scraper_save(
-    scraper_application: Scraper, mock_database: mock.MagicMock, mock_database_per_page: mock.MagicMock
+    scraper_application: Scraper, mock_database: MockDatabase, mock_database_per_page: MockDatabase
 ) -> None:
     @scraper_application.save("custom")
     def save_to_database(data: Any, output: Optional[str]) -> bool:
@@ -101,14 +169,13 @@ def scraper_save(
         return True
 
 
-@pytest.fixture()
-def expected_data(base_url: str) -> List[Dict]:
-    is_integer = IsInteger()
+@pytest.fixture(scope="session")
+def _expected_data_template(base_url: str) -> List[Dict]:
     return [
         {
             "_page_number": 1,
             "_page_url": base_url,
-            "_group_id": is_integer,
+            "_group_id": IS_INTEGER,
             "_group_index": 0,
             "_element_index": 0,
             "url": "url-1.html",
@@ -117,7 +184,7 @@ def expected_data(base_url: str) -> List[Dict]:
         {
             "_page_number": 1,
             "_page_url": base_url,
-            "_group_id": is_integer,
+            "_group_id": IS_INTEGER,
             "_group_index": 1,
             "_element_index": 0,
             "url": "url-2.html",
@@ -126,7 +193,7 @@ def expected_data(base_url: str) -> List[Dict]:
         {
             "_page_number": 1,
             "_page_url": base_url,
-            "_group_id": is_integer,
+            "_group_id": IS_INTEGER,
             "_group_index": 2,
             "_element_index": 0,
             "url": "url-3.html",
@@ -136,13 +203,17 @@ def expected_data(base_url: str) -> List[Dict]:
 
 
 @pytest.fixture()
-def expected_browser_data(file_url: str) -> List[Dict]:
-    is_integer = IsInteger()
+def expected_data(_expected_data_template: List[Dict]) -> List[Dict]:
+    return [d.copy() for d in _expected_data_template]
+
+
+@pytest.fixture(scope="session")
+def _expected_browser_data_template(file_url: str) -> List[Dict]:
     return [
         {
             "_page_number": 1,
             "_page_url": file_url,
-            "_group_id": is_integer,
+            "_group_id": IS_INTEGER,
             "_group_index": 0,
             "_element_index": 0,
             "url": IsUrl("url-1.html", file_url),
@@ -151,7 +222,7 @@ def expected_browser_data(file_url: str) -> List[Dict]:
         {
             "_page_number": 1,
             "_page_url": file_url,
-            "_group_id": is_integer,
+            "_group_id": IS_INTEGER,
             "_group_index": 1,
             "_element_index": 0,
             "url": IsUrl("url-2.html", file_url),
@@ -160,10 +231,15 @@ def expected_browser_data(file_url: str) -> List[Dict]:
         {
             "_page_number": 1,
             "_page_url": file_url,
-            "_group_id": is_integer,
+            "_group_id": IS_INTEGER,
             "_group_index": 2,
             "_element_index": 0,
             "url": IsUrl("url-3.html", file_url),
             "title": "Title 3",
         },
     ]
+
+
+@pytest.fixture()
+def expected_browser_data(_expected_browser_data_template: List[Dict]) -> List[Dict]:
+    return [d.copy() for d in _expected_browser_data_template]
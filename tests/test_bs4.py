@@ -1,7 +1,6 @@
 import unittest.mock
 import urllib
 from typing import Any, Dict, Iterable, List, Optional
-from unittest import mock
 from urllib.parse import urljoin
 
 import pytest
@@ -13,6 +12,8 @@ from respx import Router
 from dude import Scraper
 from dude.optional.beautifulsoup_scraper import BeautifulSoupScraper
 
+from .conftest import MockDatabase
+
 
 @pytest.fixture()
 def scraper_application_with_bs4_parser(blocked_url: str) -> Scraper:
@@ -42,6 +43,27 @@ def bs4_select(scraper_application: Scraper) -> None:
         return {"url": element["href"]}
 
 
+@pytest.fixture()
+def bs4_compound_and_id_select(scraper_application: Scraper) -> List[str]:
+    matched_ids: List[str] = []
+
+    @scraper_application.group(css="div.custom-group")
+    @scraper_application.select(css="a.url > p.title")
+    def title(element: BeautifulSoup) -> Dict:
+        return {"title": element.get_text()}
+
+    @scraper_application.select(css="#title-2", group_css="div.custom-group")
+    def by_id(element: BeautifulSoup) -> Dict:
+        matched_ids.append(element.get_text())
+        return {}
+
+    @scraper_application.select(css="a.url", group_css="div.custom-group")
+    def url(element: BeautifulSoup) -> Dict:
+        return {"url": element["href"]}
+
+    return matched_ids
+
+
 @pytest.fixture()
 def async_bs4_select(scraper_application: Scraper) -> None:
     @scraper_application.group(css=".custom-group")
@@ -143,7 +165,7 @@ def async_bs4_select_with_parser(scraper_application_with_bs4_parser: Scraper) -
 
 
 @pytest.fixture()
-def scraper_with_parser_save(scraper_application_with_bs4_parser: Scraper, mock_database: mock.MagicMock) -> None:
+def scraper_with_parser_save(scraper_application_with_bs4_parser: Scraper, mock_database: MockDatabase) -> None:
     @scraper_application_with_bs4_parser.save("custom")
     def save_to_database(data: Any, output: Optional[str]) -> bool:
         mock_database.save(data)
@@ -174,8 +196,8 @@ def test_full_flow_bs4(
     expected_data: List[Dict],
     base_url: str,
     scraper_save: None,
-    mock_database: mock.MagicMock,
-    mock_database_per_page: mock.MagicMock,
+    mock_database: MockDatabase,
+    mock_database_per_page: MockDatabase,
     mock_httpx: Router,
 ) -> None:
     assert scraper_application.has_async is False
@@ -189,14 +211,31 @@ def test_full_flow_bs4(
     mock_database.save.assert_not_called()
 
 
+def test_full_flow_bs4_compound_and_id(
+    scraper_application: Scraper,
+    bs4_compound_and_id_select: List[str],
+    expected_data: List[Dict],
+    base_url: str,
+    scraper_save: None,
+    mock_database: MockDatabase,
+    mock_httpx: Router,
+) -> None:
+    assert len(scraper_application.rules) == 3
+
+    scraper_application.run(urls=[base_url], pages=2, format="custom", parser="bs4")
+
+    mock_database.save.assert_called_with(expected_data)
+    assert bs4_compound_and_id_select == ["Title 2"]
+
+
 def test_follow_url(
     scraper_application: Scraper,
     bs4_follow_url: None,
     expected_data: List[Dict],
     base_url: str,
     scraper_save: None,
-    mock_database: mock.MagicMock,
-    mock_database_per_page: mock.MagicMock,
+    mock_database: MockDatabase,
+    mock_database_per_page: MockDatabase,
     mock_httpx: Router,
 ) -> None:
     assert scraper_application.has_async is False
@@ -226,7 +265,7 @@ def test_bs4_httpx_exception(
     bs4_select: None,
     expected_data: List[Dict],
     scraper_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
     base_url: str,
     mock_httpx: Router,
 ) -> None:
@@ -244,7 +283,7 @@ def test_full_flow_bs4_async(
     expected_data: List[Dict],
     base_url: str,
     scraper_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
     mock_httpx: Router,
 ) -> None:
     assert scraper_application.has_async is True
@@ -261,7 +300,7 @@ def test_full_flow_bs4_httpx_async(
     expected_data: List[Dict],
     base_url: str,
     scraper_save: None,
-    mock_database_per_page: mock.MagicMock,
+    mock_database_per_page: MockDatabase,
     mock_httpx: Router,
 ) -> None:
     assert scraper_application.has_async is True
@@ -277,7 +316,7 @@ def test_bs4_httpx_exception_async(
     async_bs4_select: None,
     expected_data: List[Dict],
     scraper_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
     base_url: str,
     mock_httpx: Router,
 ) -> None:
@@ -295,7 +334,7 @@ def test_unsupported_xpath(
     expected_data: List[Dict],
     base_url: str,
     scraper_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
     mock_httpx: Router,
 ) -> None:
     assert scraper_application.has_async is False
@@ -311,7 +350,7 @@ def test_unsupported_text(
     expected_data: List[Dict],
     base_url: str,
     scraper_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
     mock_httpx: Router,
 ) -> None:
     assert scraper_application.has_async is False
@@ -327,7 +366,7 @@ def test_unsupported_regex(
     expected_data: List[Dict],
     base_url: str,
     scraper_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
     mock_httpx: Router,
 ) -> None:
     assert scraper_application.has_async is False
@@ -341,7 +380,7 @@ def test_scraper_with_parser(
     scraper_application_with_bs4_parser: Scraper,
     bs4_select_with_parser: None,
     scraper_with_parser_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
     blocked_url: str,
     mock_httpx: Router,
 ) -> None:
@@ -358,7 +397,7 @@ def test_async_scraper_with_parser(
     scraper_application_with_bs4_parser: Scraper,
     async_bs4_select_with_parser: None,
     scraper_with_parser_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
     blocked_url: str,
     mock_httpx: Router,
 ) -> None:
@@ -378,8 +417,8 @@ def test_full_flow_post_bs4(
     expected_data: List[Dict],
     base_url: str,
     scraper_save: None,
-    mock_database: mock.MagicMock,
-    mock_database_per_page: mock.MagicMock,
+    mock_database: MockDatabase,
+    mock_database_per_page: MockDatabase,
     mock_httpx: Router,
     method: str,
 ) -> None:
@@ -402,7 +441,7 @@ def test_robots(
     scraper_application: Scraper,
     bs4_select: None,
     scraper_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
     base_url: str,
     mock_httpx: Router,
 ) -> None:
@@ -1,5 +1,4 @@
 from typing import Dict, List
-from unittest import mock
 from urllib.parse import urljoin
 
 import pytest
@@ -8,6 +7,8 @@ from respx import Router
 
 from dude import Scraper
 
+from .conftest import MockDatabase
+
 
 @pytest.fixture()
 def lxml_css(scraper_application: Scraper) -> None:
@@ -30,6 +31,27 @@ def lxml_css(scraper_application: Scraper) -> None:
         return {"url": element.attrib["href"]}
 
 
+@pytest.fixture()
+def lxml_compound_and_id_select(scraper_application: Scraper) -> List[str]:
+    matched_ids: List[str] = []
+
+    @scraper_application.group(css="div.custom-group")
+    @scraper_application.select(css="a.url > p.title")
+    def title(element: _Element) -> Dict:
+        return {"title": element.text}
+
+    @scraper_application.select(css="#title-2", group_css="div.custom-group")
+    def by_id(element: _Element) -> Dict:
+        matched_ids.append(element.text)
+        return {}
+
+    @scraper_application.select(css="a.url", group_css="div.custom-group")
+    def url(element: _Element) -> Dict:
+        return {"url": element.attrib["href"]}
+
+    return matched_ids
+
+
 @pytest.fixture()
 def async_lxml_css(scraper_application: Scraper) -> None:
     @scraper_application.group(css=".custom-group")
@@ -94,8 +116,8 @@ def test_full_flow_lxml(
     expected_data: List[Dict],
     base_url: str,
     scraper_save: None,
-    mock_database: mock.MagicMock,
-    mock_database_per_page: mock.MagicMock,
+    mock_database: MockDatabase,
+    mock_database_per_page: MockDatabase,
     mock_httpx: Router,
 ) -> None:
     assert scraper_application.has_async is False
@@ -107,12 +129,29 @@ def test_full_flow_lxml(
     mock_database.save.assert_not_called()
 
 
+def test_full_flow_lxml_compound_and_id(
+    scraper_application: Scraper,
+    lxml_compound_and_id_select: List[str],
+    expected_data: List[Dict],
+    base_url: str,
+    scraper_save: None,
+    mock_database: MockDatabase,
+    mock_httpx: Router,
+) -> None:
+    assert len(scraper_application.rules) == 3
+
+    scraper_application.run(urls=[base_url], pages=2, format="custom", parser="lxml")
+
+    mock_database.save.assert_called_with(expected_data)
+    assert lxml_compound_and_id_select == ["Title 2"]
+
+
 def test_lxml_httpx_exception(
     scraper_application: Scraper,
     lxml_css: None,
     expected_data: List[Dict],
     scraper_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
     base_url: str,
     mock_httpx: Router,
 ) -> None:
@@ -130,7 +169,7 @@ def test_full_flow_lxml_async(
     expected_data: List[Dict],
     base_url: str,
     scraper_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
     mock_httpx: Router,
 ) -> None:
     assert scraper_application.has_async is True
@@ -147,7 +186,7 @@ def test_full_flow_lxml_httpx_async(
     expected_data: List[Dict],
     base_url: str,
     scraper_save: None,
-    mock_database_per_page: mock.MagicMock,
+    mock_database_per_page: MockDatabase,
     mock_httpx: Router,
 ) -> None:
     assert scraper_application.has_async is True
@@ -163,7 +202,7 @@ def test_lxml_httpx_exception_async(
     async_lxml_css: None,
     expected_data: List[Dict],
     scraper_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
     base_url: str,
     mock_httpx: Router,
 ) -> None:
@@ -181,7 +220,7 @@ def test_full_flow_lxml_xpath(
     expected_data: List[Dict],
     base_url: str,
     scraper_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
     mock_httpx: Router,
 ) -> None:
     assert scraper_application.has_async is False
@@ -198,7 +237,7 @@ def test_full_flow_lxml_text(
     expected_data: List[Dict],
     base_url: str,
     scraper_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
     mock_httpx: Router,
 ) -> None:
     assert scraper_application.has_async is False
@@ -215,7 +254,7 @@ def test_full_flow_lxml_regex(
     expected_data: List[Dict],
     base_url: str,
     scraper_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
     mock_httpx: Router,
 ) -> None:
     assert scraper_application.has_async is False
@@ -1,5 +1,4 @@
 from typing import Dict, List
-from unittest import mock
 from urllib.parse import urljoin
 
 import parsel
@@ -8,6 +7,8 @@ from respx import Router
 
 from dude import Scraper
 
+from .conftest import MockDatabase
+
 
 @pytest.fixture()
 def parsel_css(scraper_application: Scraper) -> None:
@@ -94,8 +95,8 @@ def test_full_flow_parsel(
     expected_data: List[Dict],
     base_url: str,
     scraper_save: None,
-    mock_database: mock.MagicMock,
-    mock_database_per_page: mock.MagicMock,
+    mock_database: MockDatabase,
+    mock_database_per_page: MockDatabase,
     mock_httpx: Router,
 ) -> None:
     assert scraper_application.has_async is False
@@ -112,7 +113,7 @@ def test_parsel_httpx_exception(
     parsel_css: None,
     expected_data: List[Dict],
     scraper_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
     base_url: str,
     mock_httpx: Router,
 ) -> None:
@@ -130,7 +131,7 @@ def test_full_flow_parsel_async(
     expected_data: List[Dict],
     base_url: str,
     scraper_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
     mock_httpx: Router,
 ) -> None:
     assert scraper_application.has_async is True
@@ -147,7 +148,7 @@ def test_full_flow_parsel_httpx_async(
     expected_data: List[Dict],
     base_url: str,
     scraper_save: None,
-    mock_database_per_page: mock.MagicMock,
+    mock_database_per_page: MockDatabase,
     mock_httpx: Router,
 ) -> None:
     assert scraper_application.has_async is True
@@ -163,7 +164,7 @@ def test_parsel_httpx_exception_async(
     async_parsel_css: None,
     expected_data: List[Dict],
     scraper_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
     base_url: str,
     mock_httpx: Router,
 ) -> None:
@@ -181,7 +182,7 @@ def test_full_flow_parsel_xpath(
     expected_data: List[Dict],
     base_url: str,
     scraper_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
     mock_httpx: Router,
 ) -> None:
     assert scraper_application.has_async is False
@@ -198,7 +199,7 @@ def test_full_flow_parsel_text(
     expected_data: List[Dict],
     base_url: str,
     scraper_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
     mock_httpx: Router,
 ) -> None:
     assert scraper_application.has_async is False
@@ -215,7 +216,7 @@ def test_full_flow_parsel_regex(
     expected_data: List[Dict],
     base_url: str,
     scraper_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
     mock_httpx: Router,
 ) -> None:
     assert scraper_application.has_async is False
@@ -1,4 +1,3 @@
-import json
 import sys
 from typing import Dict, List
 from unittest import mock
@@ -8,6 +7,8 @@ from playwright import async_api
 
 from dude import Scraper
 
+from .conftest import CallRecorder, MockDatabase
+
 
 @pytest.fixture()
 def async_playwright_select(scraper_application: Scraper) -> None:
@@ -63,7 +64,7 @@ def async_playwright_xpath(scraper_application: Scraper) -> None:
 
 
 @pytest.fixture()
-def async_playwright_startup(scraper_application: Scraper, mock_database: mock.MagicMock) -> None:
+def async_playwright_startup(scraper_application: Scraper, mock_database: MockDatabase) -> None:
     @scraper_application.startup()
     async def setup_database() -> None:
         mock_database.setup()
@@ -84,7 +85,7 @@ def async_playwright_post_setup(scraper_application: Scraper) -> None:
 
 
 @pytest.fixture()
-def async_playwright_shutdown(scraper_application: Scraper, mock_database: mock.MagicMock) -> None:
+def async_playwright_shutdown(scraper_application: Scraper, mock_database: MockDatabase) -> None:
     @scraper_application.shutdown()
     async def shutdown() -> None:
         mock_database.close()
@@ -102,8 +103,8 @@ def test_full_flow(
     scraper_save: None,
     expected_browser_data: List[Dict],
     file_url: str,
-    mock_database: mock.MagicMock,
-    mock_database_per_page: mock.MagicMock,
+    mock_database: MockDatabase,
+    mock_database_per_page: MockDatabase,
 ) -> None:
     assert scraper_application.has_async is True
     assert len(scraper_application.rules) == 6
@@ -124,7 +125,7 @@ def test_full_flow_xpath(
     expected_browser_data: List[Dict],
     file_url: str,
     scraper_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
 ) -> None:
     assert scraper_application.has_async is True
     assert len(scraper_application.rules) == 4
@@ -140,7 +141,7 @@ def test_custom_save(
     expected_browser_data: List[Dict],
     file_url: str,
     scraper_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
 ) -> None:
     assert scraper_application.has_async is True
     assert len(scraper_application.rules) == 4
@@ -157,7 +158,7 @@ def test_async_save(
     expected_browser_data: List[Dict],
     file_url: str,
     scraper_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
 ) -> None:
     assert scraper_application.has_async is True
     assert len(scraper_application.rules) == 4
@@ -180,22 +181,20 @@ def test_failed_to_save(
 ) -> None:
     assert scraper_application.has_async is True
     assert len(scraper_application.rules) == 4
-    mock_save = mock.MagicMock()
-    mock_save.return_value = False
+    mock_save = CallRecorder(return_value=False)
     scraper_application.save(format="fail_db")(mock_save)
     with pytest.raises(Exception):
         scraper_application.run(urls=[file_url], pages=2, output="failing.fail_db", parser="playwright")
 
 
-@mock.patch.object(json, "dump")
 def test_save(
-    mock_dump: mock.MagicMock,
     scraper_application: Scraper,
     async_playwright_select: None,
     expected_browser_data: List[Dict],
     file_url: str,
+    patched_storage: Dict[str, CallRecorder],
 ) -> None:
     assert scraper_application.has_async is True
     assert len(scraper_application.rules) == 4
     scraper_application.run(urls=[file_url], format="json")
-    mock_dump.assert_called()
+    patched_storage["_dump_json"].assert_called()
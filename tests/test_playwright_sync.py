@@ -1,17 +1,16 @@
-import json
 from typing import Any, Dict, List, Optional
-from unittest import mock
 from urllib.parse import urljoin
 
 import pytest
-import yaml
 from braveblock import Adblocker
 from playwright import sync_api
 
-from dude import Scraper, storage
+from dude import Scraper
 from dude.playwright_scraper import PlaywrightScraper
 from dude.storage import save_csv, save_json, save_yaml
 
+from .conftest import CallRecorder, MockDatabase
+
 
 @pytest.fixture()
 def playwright_select(scraper_application: Scraper) -> None:
@@ -90,7 +89,7 @@ def playwright_navigate(scraper_application: Scraper) -> None:
 
 
 @pytest.fixture()
-def playwright_startup(scraper_application: Scraper, mock_database: mock.MagicMock) -> None:
+def playwright_startup(scraper_application: Scraper, mock_database: MockDatabase) -> None:
     @scraper_application.startup()
     def setup_database() -> None:
         mock_database.setup()
@@ -111,7 +110,7 @@ def playwright_post_setup(scraper_application: Scraper) -> None:
 
 
 @pytest.fixture()
-def playwright_shutdown(scraper_application: Scraper, mock_database: mock.MagicMock) -> None:
+def playwright_shutdown(scraper_application: Scraper, mock_database: MockDatabase) -> None:
     @scraper_application.shutdown()
     def close_database() -> None:
         mock_database.close()
@@ -125,7 +124,7 @@ def scraper_application_with_parser() -> Scraper:
 
 
 @pytest.fixture()
-def scraper_with_parser_save(scraper_application_with_parser: Scraper, mock_database: mock.MagicMock) -> None:
+def scraper_with_parser_save(scraper_application_with_parser: Scraper, mock_database: MockDatabase) -> None:
     @scraper_application_with_parser.save("custom")
     def save_to_database(data: Any, output: Optional[str]) -> bool:
         mock_database.save(data)
@@ -170,8 +169,8 @@ def test_full_flow(
     scraper_save: None,
     expected_browser_data: List[Dict],
     file_url: str,
-    mock_database: mock.MagicMock,
-    mock_database_per_page: mock.MagicMock,
+    mock_database: MockDatabase,
+    mock_database_per_page: MockDatabase,
     browser_type: str,
 ) -> None:
     assert scraper_application.has_async is False
@@ -199,8 +198,8 @@ def test_follow_url(
     scraper_save: None,
     expected_browser_data: List[Dict],
     file_url: str,
-    mock_database: mock.MagicMock,
-    mock_database_per_page: mock.MagicMock,
+    mock_database: MockDatabase,
+    mock_database_per_page: MockDatabase,
 ) -> None:
     assert scraper_application.has_async is False
     assert len(scraper_application.rules) == 5
@@ -223,7 +222,7 @@ def test_full_flow_xpath(
     expected_browser_data: List[Dict],
     file_url: str,
     scraper_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
 ) -> None:
     assert scraper_application.has_async is False
     assert len(scraper_application.rules) == 4
@@ -239,7 +238,7 @@ def test_custom_save(
     expected_browser_data: List[Dict],
     file_url: str,
     scraper_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
 ) -> None:
     assert scraper_application.has_async is False
     assert len(scraper_application.rules) == 4
@@ -255,7 +254,7 @@ def test_scraper_with_parser(
     expected_browser_data: List[Dict],
     file_url: str,
     scraper_with_parser_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
 ) -> None:
     assert scraper_application_with_parser.has_async is False
     assert scraper_application_with_parser.scraper is not None
@@ -278,100 +277,93 @@ def test_failed_to_save(
 ) -> None:
     assert scraper_application.has_async is False
     assert len(scraper_application.rules) == 4
-    mock_save = mock.MagicMock()
-    mock_save.return_value = False
+    mock_save = CallRecorder(return_value=False)
     scraper_application.save(format="fail_db")(mock_save)
     with pytest.raises(Exception):
         scraper_application.run(urls=[file_url], pages=2, output="failing.fail_db", parser="playwright")
 
 
-@mock.patch.object(json, "dump")
 def test_save_json(
-    mock_dump: mock.MagicMock,
     scraper_application: Scraper,
     playwright_select: None,
     expected_browser_data: List[Dict],
     file_url: str,
+    patched_storage: Dict[str, CallRecorder],
 ) -> None:
     assert scraper_application.has_async is False
     assert len(scraper_application.rules) == 4
     scraper_application.save(format="json")(save_json)
     scraper_application.run(urls=[file_url], format="json")
-    mock_dump.assert_called()
+    patched_storage["_dump_json"].assert_called()
 
 
-@mock.patch.object(json, "dump")
 def test_save_csv(
-    mock_dump: mock.MagicMock,
     scraper_application: Scraper,
     playwright_select: None,
     expected_browser_data: List[Dict],
     file_url: str,
+    patched_storage: Dict[str, CallRecorder],
 ) -> None:
     assert scraper_application.has_async is False
     assert len(scraper_application.rules) == 4
     scraper_application.save(format="csv")(save_csv)
     scraper_application.run(urls=[file_url], format="csv")
-    mock_dump.assert_called()
+    patched_storage["_dump_json"].assert_called()
 
 
-@mock.patch.object(yaml, "safe_dump")
 def test_save_yaml(
-    mock_safe_dump: mock.MagicMock,
     scraper_application: Scraper,
     playwright_select: None,
     expected_browser_data: List[Dict],
     file_url: str,
+    patched_storage: Dict[str, CallRecorder],
 ) -> None:
     assert scraper_application.has_async is False
     assert len(scraper_application.rules) == 4
     scraper_application.save(format="yaml")(save_yaml)
     scraper_application.run(urls=[file_url], format="yaml")
-    mock_safe_dump.assert_called()
+    patched_storage["yaml.dump"].assert_called()
 
 
-@mock.patch.object(storage, "_save_json")
 def test_save_json_file(
-    mock_save: mock.MagicMock,
     scraper_application: Scraper,
     playwright_select: None,
     expected_browser_data: List[Dict],
     file_url: str,
+    patched_storage: Dict[str, CallRecorder],
 ) -> None:
     assert scraper_application.has_async is False
     assert len(scraper_application.rules) == 4
     scraper_application.run(urls=[file_url], output="output.json")
-    mock_save.assert_called_with(expected_browser_data, "output.json")
+    patched_storage["_save_json"].assert_called_with(expected_browser_data, "output.json")
 
 
-@mock.patch.object(storage, "_save_csv")
 def test_save_csv_file(
-    mock_save: mock.MagicMock,
     scraper_application: Scraper,
     playwright_select: None,
     expected_browser_data: List[Dict],
     file_url: str,
+    patched_storage: Dict[str, CallRecorder],
 ) -> None:
     assert scraper_application.has_async is False
     assert len(scraper_application.rules) == 4
     scraper_application.save(format="csv")(save_csv)
     scraper_application.run(urls=[file_url], output="output.csv")
-    mock_save.assert_called_with(expected_browser_data, "output.csv")
+    patched_storage["_save_csv"].assert_called_with(expected_browser_data, "output.csv")
 
 
-@mock.patch.object(storage, "_save_yaml")
 def test_save_yaml_file(
-    mock_save: mock.MagicMock,
     scraper_application: Scraper,
     playwright_select: None,
     expected_browser_data: List[Dict],
     file_url: str,
+    patched_storage: Dict[str, CallRecorder],
 ) -> None:
     assert scraper_application.has_async is False
     assert len(scraper_application.rules) == 4
     scraper_application.save(format="yaml")(save_yaml)
     scraper_application.run(urls=[file_url], output="output.yaml")
-    mock_save.assert_called_with(expected_browser_data, "output.yaml")
+    patched_storage["_save_yaml"].assert_called_with(expected_browser_data, "output.yaml")
 
 
 def test_playwright_invalid_group(scraper_application: Scraper) -> None:
@@ -1,5 +1,4 @@
 from typing import Any, Dict, List, Optional
-from unittest import mock
 
 import pytest
 from braveblock import Adblocker
@@ -9,6 +8,8 @@ from pyppeteer.page import Page
 from dude import Scraper
 from dude.optional.pyppeteer_scraper import PyppeteerScraper
 
+from .conftest import MockDatabase
+
 
 @pytest.fixture()
 def scraper_application_with_pyppeteer_parser() -> Scraper:
@@ -114,7 +115,7 @@ def async_pyppeteer_navigate(scraper_application: Scraper) -> None:
 
 
 @pytest.fixture()
-def scraper_with_parser_save(scraper_application_with_pyppeteer_parser: Scraper, mock_database: mock.MagicMock) -> None:
+def scraper_with_parser_save(scraper_application_with_pyppeteer_parser: Scraper, mock_database: MockDatabase) -> None:
     @scraper_application_with_pyppeteer_parser.save("custom")
     def save_to_database(data: Any, output: Optional[str]) -> bool:
         mock_database.save(data)
@@ -129,8 +130,8 @@ def test_full_flow(
     expected_browser_data: List[Dict],
     file_url: str,
     scraper_save: None,
-    mock_database: mock.MagicMock,
-    mock_database_per_page: mock.MagicMock,
+    mock_database: MockDatabase,
+    mock_database_per_page: MockDatabase,
 ) -> None:
     assert scraper_application.has_async is True
     assert len(scraper_application.rules) == 6
@@ -147,7 +148,7 @@ def test_full_flow_async_without_setup_and_navigate(
     expected_browser_data: List[Dict],
     file_url: str,
     scraper_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
 ) -> None:
     assert scraper_application.has_async is True
     assert len(scraper_application.rules) == 4
@@ -165,7 +166,7 @@ def test_full_flow_xpath(
     expected_browser_data: List[Dict],
     file_url: str,
     scraper_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
 ) -> None:
     assert scraper_application.has_async is True
     assert len(scraper_application.rules) == 4
@@ -183,7 +184,7 @@ def test_full_flow_text(
     expected_browser_data: List[Dict],
     file_url: str,
     scraper_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
 ) -> None:
     assert scraper_application.has_async is True
     assert len(scraper_application.rules) == 4
@@ -212,7 +213,7 @@ def test_scraper_with_parser(
     expected_browser_data: List[Dict],
     file_url: str,
     scraper_with_parser_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
 ) -> None:
     assert scraper_application_with_pyppeteer_parser.has_async is True
     assert scraper_application_with_pyppeteer_parser.scraper is not None
@@ -0,0 +1,200 @@
+from typing import Dict, List
+from urllib.parse import urljoin
+
+import pytest
+from respx import Router
+from selectolax.lexbor import LexborNode
+
+from dude import Scraper
+
+from .conftest import MockDatabase
+
+
+@pytest.fixture()
+def selectolax_select(scraper_application: Scraper) -> None:
+    @scraper_application.group(css=".custom-group")
+    @scraper_application.select(css=".title")
+    def title(element: LexborNode) -> Dict:
+        return {"title": element.text()}
+
+    @scraper_application.select(css=".title", group_css=".custom-group")
+    def empty(element: LexborNode) -> Dict:
+        return {}
+
+    @scraper_application.group(css=".custom-group")
+    @scraper_application.select(css=".title", url_match="example.com")
+    def url_dont_match(element: LexborNode) -> Dict:
+        return {"title": element.text()}
+
+    @scraper_application.select(css=".url", group_css=".custom-group")
+    def url(element: LexborNode) -> Dict:
+        return {"url": element.attributes["href"]}
+
+
+@pytest.fixture()
+def async_selectolax_select(scraper_application: Scraper) -> None:
+    @scraper_application.group(css=".custom-group")
+    @scraper_application.select(css=".title")
+    async def title(element: LexborNode) -> Dict:
+        return {"title": element.text()}
+
+    @scraper_application.select(css=".title", group_css=".custom-group")
+    async def empty(element: LexborNode) -> Dict:
+        return {}
+
+    @scraper_application.group(css=".custom-group")
+    @scraper_application.select(css=".title", url_match="example.com")
+    async def url_dont_match(element: LexborNode) -> Dict:
+        return {"title": element.text()}
+
+    @scraper_application.select(css=".url", group_css=".custom-group")
+    async def url(element: LexborNode) -> Dict:
+        return {"url": element.attributes["href"]}
+
+
+@pytest.fixture()
+def selectolax_root(scraper_application: Scraper) -> None:
+    @scraper_application.select(css=".title")
+    def title(element: LexborNode) -> Dict:
+        return {"title": element.text()}
+
+
+@pytest.fixture()
+def selectolax_xpath(scraper_application: Scraper) -> None:
+    @scraper_application.select(
+        xpath='.//p[contains(@class, "title")]/text()', group_xpath='.//div[contains(@class, "custom-group")]'
+    )
+    def title(element: LexborNode) -> Dict:
+        return {"title": element.text()}
+
+
+@pytest.fixture()
+def selectolax_text(scraper_application: Scraper) -> None:
+    @scraper_application.select(text="Title", group_css=".custom-group")
+    def title(element: LexborNode) -> Dict:
+        return {"title": element.text()}
+
+
+@pytest.fixture()
+def selectolax_regex(scraper_application: Scraper) -> None:
+    @scraper_application.select(regex=r"Title\s\d", group_css=".custom-group")
+    def title(element: LexborNode) -> Dict:
+        return {"title": element.text()}
+
+
+def test_full_flow_selectolax(
+    scraper_application: Scraper,
+    selectolax_select: None,
+    expected_data: List[Dict],
+    base_url: str,
+    scraper_save: None,
+    mock_database: MockDatabase,
+    mock_database_per_page: MockDatabase,
+    mock_httpx: Router,
+) -> None:
+    assert scraper_application.has_async is False
+    assert len(scraper_application.rules) == 4
+
+    scraper_application.run(urls=[base_url], pages=2, format="custom", parser="selectolax", follow_urls=True)
+
+    mock_database_per_page.save.assert_called_with(expected_data)
+    mock_database.save.assert_not_called()
+
+
+def test_selectolax_root_group(
+    scraper_application: Scraper,
+    selectolax_root: None,
+    base_url: str,
+    scraper_save: None,
+    mock_database: MockDatabase,
+    mock_httpx: Router,
+) -> None:
+    assert scraper_application.has_async is False
+    assert len(scraper_application.rules) == 1
+
+    scraper_application.run(urls=[base_url], format="custom", parser="selectolax")
+
+    assert [item["title"] for item in mock_database.save.calls[-1][0][0]] == ["Title 1", "Title 2", "Title 3"]
+
+
+def test_selectolax_httpx_exception(
+    scraper_application: Scraper,
+    selectolax_select: None,
+    scraper_save: None,
+    mock_database: MockDatabase,
+    base_url: str,
+    mock_httpx: Router,
+) -> None:
+    assert scraper_application.has_async is False
+    assert len(scraper_application.rules) == 4
+
+    scraper_application.run(urls=[urljoin(base_url, "error.html")], pages=2, format="custom", parser="selectolax")
+
+    mock_database.save.assert_not_called()
+
+
+def test_full_flow_selectolax_async(
+    scraper_application: Scraper,
+    async_selectolax_select: None,
+    expected_data: List[Dict],
+    base_url: str,
+    scraper_save: None,
+    mock_database: MockDatabase,
+    mock_httpx: Router,
+) -> None:
+    assert scraper_application.has_async is True
+    assert len(scraper_application.rules) == 4
+
+    scraper_application.run(urls=[base_url], pages=2, format="custom", parser="selectolax")
+
+    mock_database.save.assert_called_with(expected_data)
+
+
+def test_full_flow_selectolax_httpx_async(
+    scraper_application: Scraper,
+    async_selectolax_select: None,
+    expected_data: List[Dict],
+    base_url: str,
+    scraper_save: None,
+    mock_database_per_page: MockDatabase,
+    mock_httpx: Router,
+) -> None:
+    assert scraper_application.has_async is True
+    assert len(scraper_application.rules) == 4
+
+    scraper_application.run(urls=[base_url], pages=2, format="custom", parser="selectolax", follow_urls=True)
+
+    mock_database_per_page.save.assert_called_with(expected_data)
+
+
+def test_selectolax_httpx_exception_async(
+    scraper_application: Scraper,
+    async_selectolax_select: None,
+    scraper_save: None,
+    mock_database: MockDatabase,
+    base_url: str,
+    mock_httpx: Router,
+) -> None:
+    assert scraper_application.has_async is True
+    assert len(scraper_application.rules) == 4
+
+    scraper_application.run(urls=[urljoin(base_url, "error.html")], pages=2, format="custom", parser="selectolax")
+
+    mock_database.save.assert_not_called()
+
+
+@pytest.mark.parametrize("fixture", ("selectolax_xpath", "selectolax_text", "selectolax_regex"))
+def test_unsupported_selectors(
+    scraper_application: Scraper,
+    base_url: str,
+    scraper_save: None,
+    mock_httpx: Router,
+    fixture: str,
+    request: pytest.FixtureRequest,
+) -> None:
+    request.getfixturevalue(fixture)
+    assert scraper_application.has_async is False
+    assert len(scraper_application.rules) == 1
+
+    with pytest.raises(Exception):
+        scraper_application.run(urls=[base_url], pages=2, format="custom", parser="selectolax")
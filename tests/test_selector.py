@@ -1,10 +1,10 @@
-from typing import Dict
+from typing import Dict, Optional, Tuple
 
 import pytest
 from playwright import sync_api
 
 from dude import Scraper
-from dude.rule import Selector, SelectorType
+from dude.rule import Selector, SelectorType, classify_css
 
 
 @pytest.mark.parametrize(
@@ -25,6 +25,23 @@ def test_to_str(
     assert selector.selector_type() == expected_type
 
 
+@pytest.mark.parametrize(
+    ("selector", "expected"),
+    (
+        pytest.param(".title", ("class", "title"), id="class"),
+        pytest.param(".custom-group", ("class", "custom-group"), id="class-with-dash"),
+        pytest.param("#main", ("id", "main"), id="id"),
+        pytest.param("p.title", None, id="tag-and-class"),
+        pytest.param(".a .b", None, id="descendant"),
+        pytest.param(".a.b", None, id="compound"),
+        pytest.param(":root", None, id="pseudo-class"),
+        pytest.param("a[href]", None, id="attribute"),
+    ),
+)
+def test_classify_css(selector: str, expected: Optional[Tuple[str, str]]) -> None:
+    assert classify_css(selector) == expected
+
+
 def test_invalid_to_str() -> None:
     selector = Selector()
     with pytest.raises(AssertionError):
@@ -13,6 +13,8 @@ from dude import Scraper
 from dude.optional.selenium_scraper import SeleniumScraper
 from dude.optional.utils import get_chromedriver_latest_release
 
+from .conftest import CallRecorder, MockDatabase
+
 
 @pytest.fixture()
 def scraper_application_with_selenium_parser() -> Scraper:
@@ -174,7 +176,7 @@ def async_selenium_navigate(scraper_application: Scraper) -> None:
 
 
 @pytest.fixture()
-def scraper_with_parser_save(scraper_application_with_selenium_parser: Scraper, mock_database: mock.MagicMock) -> None:
+def scraper_with_parser_save(scraper_application_with_selenium_parser: Scraper, mock_database: MockDatabase) -> None:
     @scraper_application_with_selenium_parser.save("custom")
     def save_to_database(data: Any, output: Optional[str]) -> bool:
         mock_database.save(data)
@@ -197,8 +199,8 @@ def test_full_flow(
     file_url: str,
     browser_type: str,
     scraper_save: None,
-    mock_database: mock.MagicMock,
-    mock_database_per_page: mock.MagicMock,
+    mock_database: MockDatabase,
+    mock_database_per_page: MockDatabase,
 ) -> None:
     assert scraper_application.has_async is False
     assert len(scraper_application.rules) == 6
@@ -217,7 +219,7 @@ def test_full_flow_without_setup_and_navigate(
     expected_browser_data: List[Dict],
     file_url: str,
     scraper_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
 ) -> None:
     assert scraper_application.has_async is False
     assert len(scraper_application.rules) == 4
@@ -235,7 +237,7 @@ def test_full_flow_xpath(
     expected_browser_data: List[Dict],
     file_url: str,
     scraper_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
 ) -> None:
     assert scraper_application.has_async is False
     assert len(scraper_application.rules) == 4
@@ -253,7 +255,7 @@ def test_full_flow_text(
     expected_browser_data: List[Dict],
     file_url: str,
     scraper_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
 ) -> None:
     assert scraper_application.has_async is False
     assert len(scraper_application.rules) == 4
@@ -279,8 +281,8 @@ def test_full_flow_async(
     file_url: str,
     browser_type: str,
     scraper_save: None,
-    mock_database: mock.MagicMock,
-    mock_database_per_page: mock.MagicMock,
+    mock_database: MockDatabase,
+    mock_database_per_page: MockDatabase,
 ) -> None:
     assert scraper_application.has_async is True
     assert len(scraper_application.rules) == 6
@@ -301,7 +303,7 @@ def test_full_flow_async_with_sync_setup_and_navigate(
     expected_browser_data: List[Dict],
     file_url: str,
     scraper_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
 ) -> None:
     assert scraper_application.has_async is True
     assert len(scraper_application.rules) == 6
@@ -317,7 +319,7 @@ def test_full_flow_async_without_setup_and_navigate(
     expected_browser_data: List[Dict],
     file_url: str,
     scraper_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
 ) -> None:
     assert scraper_application.has_async is True
     assert len(scraper_application.rules) == 4
@@ -335,7 +337,7 @@ def test_full_flow_xpath_async(
     expected_browser_data: List[Dict],
     file_url: str,
     scraper_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
 ) -> None:
     assert scraper_application.has_async is True
     assert len(scraper_application.rules) == 4
@@ -353,7 +355,7 @@ def test_full_flow_text_async(
     expected_browser_data: List[Dict],
     file_url: str,
     scraper_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
 ) -> None:
     assert scraper_application.has_async is True
     assert len(scraper_application.rules) == 4
@@ -371,7 +373,7 @@ def test_unsupported_regex(
 ) -> None:
     assert scraper_application.has_async is False
     assert len(scraper_application.rules) == 1
-    mock_save = mock.MagicMock()
+    mock_save = CallRecorder(return_value=True)
     scraper_application.save(format="custom")(mock_save)
     with pytest.raises(Exception):
         scraper_application.run(urls=[file_url], pages=2, format="custom", parser="selenium")
@@ -383,7 +385,7 @@ def test_scraper_with_parser(
     expected_browser_data: List[Dict],
     file_url: str,
     scraper_with_parser_save: None,
-    mock_database: mock.MagicMock,
+    mock_database: MockDatabase,
 ) -> None:
     assert scraper_application_with_selenium_parser.has_async is False
     assert scraper_application_with_selenium_parser.scraper is not None
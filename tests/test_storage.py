@@ -0,0 +1,130 @@
+import csv
+import dataclasses
+import datetime
+import enum
+import io
+import json
+import sys
+import uuid
+from typing import Any, Dict, List, Type, Union
+
+import pytest
+
+from dude.storage import ColumnStore, _dump_json
+
+
+def dump_json(data: List[Dict], encoding: str = "utf-8") -> str:
+    buffer = io.BytesIO()
+    stream = io.TextIOWrapper(buffer, encoding=encoding)
+    _dump_json(data, stream)
+    stream.flush()
+    return buffer.getvalue().decode(encoding)
+
+
+@pytest.mark.parametrize(
+    "data",
+    (
+        pytest.param([{"title": "Title 1", "url": "url-1.html", "_group_index": 0}], id="ascii"),
+        pytest.param([{"title": "日本"}], id="non-ascii"),
+        pytest.param([{1: "one", "nested": {2: [1.5, None, True]}}], id="int-keys"),
+        pytest.param([], id="empty"),
+    ),
+)
+def test_dump_json(data: List[Dict]) -> None:
+    assert dump_json(data) == json.dumps(data, indent=2, ensure_ascii=False)
+
+
+@pytest.mark.parametrize(
+    "data",
+    (
+        pytest.param([{"big": 2**70}], id="big-int"),
+        pytest.param([{"nan": float("nan"), "inf": [float("inf")]}], id="non-finite"),
+    ),
+)
+def test_dump_json_fallback(data: List[Dict]) -> None:
+    assert dump_json(data) == json.dumps(data, indent=2)
+
+
+def test_dump_json_non_utf8_stream() -> None:
+    data = [{"title": "日本"}]
+    assert dump_json(data, encoding="cp1252") == json.dumps(data, indent=2)
+
+
+def test_dump_json_without_orjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    data: List[Dict[Any, Any]] = [{"title": "日本", 1: 2}]
+    assert dump_json(data) == json.dumps(data, indent=2, ensure_ascii=False)
+
+
+class Color(enum.Enum):
+    RED = "red"
+
+
+class Size(enum.IntEnum):
+    SMALL = 1
+
+
+class Title(str):
+    pass
+
+
+@dataclasses.dataclass
+class Item:
+    title: str
+
+
+@pytest.mark.parametrize(
+    "data",
+    (
+        pytest.param([{"title": "日本", "_group_index": 0, "score": 0.1, "tags": ("a", "b"), "url": None}], id="plain"),
+        pytest.param([{1: "one", "nested": {2: [1.5, True]}}], id="int-keys"),
+        pytest.param([{"big": 2**70}], id="big-int"),
+        pytest.param([{"nan": float("nan")}], id="nan"),
+        pytest.param([{"date": datetime.date(2022, 1, 1)}], id="date"),
+        pytest.param([{"item": Item(title="Title 1")}], id="dataclass"),
+        pytest.param([{"color": Color.RED}], id="enum"),
+        pytest.param([{"size": Size.SMALL}], id="int-enum"),
+        pytest.param([{"id": uuid.UUID(int=1)}], id="uuid"),
+        pytest.param([{"title": Title("Title 1")}], id="str-subclass"),
+        pytest.param([{Color.RED: 1}], id="enum-key"),
+        pytest.param([{True: 1, None: 2, 1.5: 3}], id="non-int-keys"),
+    ),
+)
+def test_dump_json_same_output_without_orjson(monkeypatch: pytest.MonkeyPatch, data: List[Dict]) -> None:
+    def dump_or_error() -> Union[str, Type[Exception]]:
+        try:
+            return dump_json(data)
+        except Exception as e:
+            return type(e)
+
+    with_orjson = dump_or_error()
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    assert with_orjson == dump_or_error()
+
+
+@pytest.mark.parametrize(
+    "data",
+    (
+        pytest.param([{"title": "Title 1", "url": "url-1.html"}, {"title": "Title 2", "url": "url-2.html"}], id="same"),
+        pytest.param([{"b": 1, "a": "x"}, {"a": None, "c": 3}, {"b": 2}], id="heterogeneous"),
+        pytest.param([{"a": 1}, {"a": 2}, {"a": 3, "late": "x"}, {"a": 4}], id="late-key"),
+        pytest.param([{}, {}], id="no-keys"),
+        pytest.param([{}, {"a": 1}, {}], id="some-no-keys"),
+        pytest.param([], id="empty"),
+    ),
+)
+def test_column_store(data: List[Dict]) -> None:
+    store = ColumnStore()
+    for item in data:
+        store.append_row(item)
+    actual = io.StringIO()
+    writer = csv.writer(actual)
+    writer.writerow(store.headers)
+    writer.writerows(store.rows())
+
+    expected = io.StringIO()
+    dict_writer = csv.DictWriter(expected, fieldnames=sorted({key for item in data for key in item}))
+    dict_writer.writeheader()
+    dict_writer.writerows(data)
+
+    assert actual.getvalue() == expected.getvalue()